@@ -47,7 +47,9 @@ def get_tool_status(bug_dir: Path, tool_name: str) -> Tuple[str, bool, float]:
     results_file = tool_dir / "results.json"
     if results_file.exists():
         results_data = load_json(results_file)
-        execution_time = results_data.get("execution_time", -1)
+        # Cached runs record the cache restore time, not the tool's
+        if not results_data.get("cached", False):
+            execution_time = results_data.get("execution_time", -1)
 
     # Check if evaluation.json exists
     eval_file = tool_dir / "evaluation.json"
@@ -101,6 +101,20 @@ Examples:
         default=1800,
         help="Timeout per tool execution in seconds (default: 1800)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-run tools instead of reusing cached results of "
+        "unchanged circuits (cached results report the time taken to "
+        "restore them and are marked [Cached])",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Directory for cached tool results "
+        "(default: $XDG_CACHE_HOME/zkhydra or ~/.cache/zkhydra)",
+    )
 
     # Logging
     parser.add_argument(
@@ -225,7 +239,8 @@ Examples:
         if not args.input and not args.vanilla:
             logging.error(f"--input is required for {args.mode} mode")
             sys.exit(1)
-        if not args.input.exists():
+        # A single stat: is_file() also rejects directories
+        if not args.input.is_file():
             logging.error(f"Input file not found: {args.input}")
             sys.exit(1)
         if args.dsl != "circom":
@@ -7,22 +7,23 @@ including tool execution, result collection, and summary generation.
 """
 
 import argparse
+import contextlib
 import json
 import logging
 import multiprocessing as mp
 import os
 import random
-import re
 import shlex
 import subprocess
 import sys
+from collections import Counter
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, replace
-from datetime import datetime
 from pathlib import Path
 
 from zkhydra.printers import print_analyze_summary
 from zkhydra.tools.base import (
+    INCLUDE_RE,
     AbstractTool,
     Input,
     ToolOutput,
@@ -30,7 +31,9 @@ from zkhydra.tools.base import (
     ToolStatus,
     ensure_dir,
 )
+from zkhydra.utils.json_io import write_json
 from zkhydra.utils.logger import setup_logging
+from zkhydra.utils.tool_cache import ToolCache
 from zkhydra.utils.tools_resolver import ToolsDict, resolve_tools
 from zkhydra.utils.zkbugs_loader import (
     ZkbugsLoaderError,
@@ -100,22 +103,56 @@ AVAILABLE_TOOLS = {
     "cairo": ["sierra-analyzer"],
 }
 
+# Same as AVAILABLE_TOOLS, for membership checks
+_AVAILABLE_TOOL_SETS = {
+    dsl: frozenset(tools) for dsl, tools in AVAILABLE_TOOLS.items()
+}
+
 
-def setup_output_directory(base_output: Path, mode: str) -> tuple[Path, str]:
+def expand_tools_list(tools: str, dsl: str) -> list[str]:
+    """
+    Parse the --tools argument into a validated list of tool names.
+
+    Args:
+        tools: Comma-separated tool names, or "all"
+        dsl: Domain-specific language the tools must support
+
+    Returns:
+        Tool names in the given order, without duplicates
+    """
+    requested = [t.strip() for t in tools.split(",") if t.strip()]
+    if "all" in requested:
+        return list(AVAILABLE_TOOLS[dsl])
+
+    # Fail fast on typos instead of skipping the tool later in resolve_tools
+    unknown = [t for t in requested if t not in _AVAILABLE_TOOL_SETS[dsl]]
+    if unknown:
+        logging.error(
+            f"Unknown tool(s) for {dsl}: {', '.join(unknown)}. "
+            f"Available tools: {', '.join(AVAILABLE_TOOLS[dsl])}"
+        )
+        sys.exit(1)
+
+    return list(dict.fromkeys(requested))
+
+
+def setup_output_directory(
+    base_output: Path, mode: str, timestamp: str
+) -> Path:
     """
     Create timestamped output directory.
 
     Args:
         base_output: Base output directory
         mode: Mode name (analyze or evaluate)
+        timestamp: Run timestamp (computed once in main)
 
     Returns:
-        Tuple of (output_directory_path, timestamp)
+        Path to the output directory
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_dir = Path(base_output) / f"{mode}_{timestamp}"
+    output_dir = base_output / f"{mode}_{timestamp}"
     ensure_dir(output_dir)
-    return output_dir, timestamp
+    return output_dir
 
 
 def prepare_circuit_paths(input_path: Path) -> Input:
@@ -128,13 +165,12 @@ def prepare_circuit_paths(input_path: Path) -> Input:
     Returns:
         Input object containing absolute circuit_dir and circuit_file paths as strings
     """
-    circuit_dir = input_path.parent
-    circuit_file = input_path
-    full_path_circuit_dir = circuit_dir.resolve()
-    full_path_circuit_file = circuit_file.resolve()
+    # circuit_dir is the resolved parent of the path as given, not the
+    # directory of a symlink's target, so a symlinked circuit keeps its own
+    # directory for relative includes and output naming.
     return Input(
-        circuit_dir=str(full_path_circuit_dir),
-        circuit_file=str(full_path_circuit_file),
+        circuit_dir=os.path.realpath(os.path.dirname(input_path) or "."),
+        circuit_file=os.path.realpath(input_path),
     )
 
 
@@ -143,6 +179,7 @@ def execute_tools(
     input_paths: Input,
     output_dir: Path,
     timeout: int,
+    cache: ToolCache | None = None,
 ) -> dict[str, ToolResult]:
     """
     Execute all tools and collect results.
@@ -152,24 +189,40 @@ def execute_tools(
         input_paths: Input object containing circuit_dir and circuit_file paths
         output_dir: Output directory for results
         timeout: Timeout per tool in seconds
+        cache: Result cache to consult before running each tool (optional)
 
     Returns:
         Dictionary mapping tool names to ToolResult objects
     """
     results = {}
 
+    # Create every tool's output directory up front. output_dir already
+    # exists, so a bare mkdir per tool suffices.
+    for tool_name in tool_registry:
+        with contextlib.suppress(FileExistsError):
+            os.mkdir(output_dir / tool_name)
+
     for tool_name, tool_instance in tool_registry.items():
         logging.info(f"Running {tool_name}...")
 
-        # Create output directory for this tool
-        tool_output_dir = output_dir / tool_name
-        ensure_dir(tool_output_dir)
-        raw_output_file = Path(tool_output_dir) / "raw.txt"
-
-        # Execute tool - returns ToolOutput object
-        tool_output = tool_instance.execute(
-            input_paths, timeout, raw_output_file
-        )
+        raw_output_file = output_dir / tool_name / "raw.txt"
+
+        # Restore unchanged runs from the cache, otherwise execute the
+        # tool - both return a ToolOutput object
+        cache_key = None
+        tool_output = None
+        if cache is not None:
+            cache_key = cache.key(tool_instance, input_paths, timeout)
+            if cache_key is not None:
+                tool_output = cache.load(cache_key, raw_output_file)
+        if tool_output is not None:
+            logging.info(f"Using cached {tool_name} output ({cache_key})")
+        else:
+            tool_output = tool_instance.execute(
+                input_paths, timeout, raw_output_file
+            )
+            if cache_key is not None:
+                cache.store(cache_key, tool_output)
 
         results[tool_name] = tool_instance.process_output(tool_output)
 
@@ -177,7 +230,13 @@ def execute_tools(
 
 
 def analyze_mode(
-    circuit: Path, tools: list[str], dsl: str, timeout: int, output: Path
+    circuit: Path,
+    tools: list[str],
+    dsl: str,
+    timeout: int,
+    output: Path,
+    timestamp: str,
+    cache: ToolCache | None = None,
 ) -> None:
     """
     Analyze mode: Run tools on a circuit and report findings.
@@ -194,7 +253,7 @@ def analyze_mode(
         sys.exit(1)
 
     # Setup output directory
-    output_dir, timestamp = setup_output_directory(output, "analyze")
+    output_dir = setup_output_directory(output, "analyze", timestamp)
     logging.info(f"Output directory: {output_dir}")
 
     # Determine circuit paths
@@ -208,20 +267,24 @@ def analyze_mode(
         input_paths,
         output_dir,
         timeout,
+        cache,
     )
 
-    # Generate statistics
+    # Generate statistics in a single pass over the results
+    status_counts: Counter[ToolStatus] = Counter()
+    total_findings = 0
+    total_execution_time_ns = 0
+    for r in results.values():
+        status_counts[r.status] += 1
+        total_execution_time_ns += r.execution_time_ns
+        if r.status is ToolStatus.SUCCESS:
+            total_findings += r.findings_count
+
     statistics = Statistics(
         total_tools=len(results),
-        success=sum(
-            1 for r in results.values() if r.status == ToolStatus.SUCCESS
-        ),
-        failed=sum(
-            1 for r in results.values() if r.status == ToolStatus.FAILED
-        ),
-        timeout=sum(
-            1 for r in results.values() if r.status == ToolStatus.TIMEOUT
-        ),
+        success=status_counts[ToolStatus.SUCCESS],
+        failed=status_counts[ToolStatus.FAILED],
+        timeout=status_counts[ToolStatus.TIMEOUT],
     )
 
     # Generate summary
@@ -233,21 +296,19 @@ def analyze_mode(
         output_directory=str(output_dir),
         tools={name: result.to_dict() for name, result in results.items()},
         statistics=statistics,
-        total_findings=sum(
-            r.findings_count
-            for r in results.values()
-            if r.status == ToolStatus.SUCCESS
-        ),
-        total_execution_time=sum(r.execution_time for r in results.values()),
+        total_findings=total_findings,
+        total_execution_time=total_execution_time_ns / 1e9,
     )
 
+    # Findings are converted to dicts once, shared by the file and the CLI
+    summary_dict = summary.to_dict()
+
     # Write summary JSON
-    summary_file = Path(output_dir) / "summary.json"
-    with open(summary_file, "w", encoding="utf-8") as f:
-        json.dump(summary.to_dict(), f, indent=2, ensure_ascii=False)
+    summary_file = output_dir / "summary.json"
+    write_json(summary_file, summary_dict)
 
     # Print CLI summary
-    print_analyze_summary(summary.to_dict())
+    print_analyze_summary(summary_dict)
 
 
 def evaluate_mode(args: argparse.Namespace) -> None:
@@ -264,9 +325,6 @@ def evaluate_mode(args: argparse.Namespace) -> None:
 
 SKIP_PATH_PARTS = {"codebases", "dependencies"}
 
-# Matches: include "path"; or include 'path'; (ignoring // line comments).
-_INCLUDE_RE = re.compile(r'^\s*include\s+["\']([^"\']+)["\']\s*;', re.MULTILINE)
-
 
 def _is_excluded_config(config_path: Path) -> bool:
     """Skip configs that are not actual bugs (shared codebases, deps)."""
@@ -289,7 +347,7 @@ def _wrapper_needs_codebase(circuit_file: str | None, bug_dir: Path) -> bool:
         src = Path(circuit_file).read_text(encoding="utf-8", errors="replace")
     except OSError:
         return False
-    for inc in _INCLUDE_RE.findall(src):
+    for inc in INCLUDE_RE.findall(src):
         candidate = Path(inc)
         if candidate.is_absolute():
             if candidate.is_file():
@@ -562,6 +620,7 @@ def _process_one_bug(
     needs_artifacts: bool,
     in_worker: bool,
     log_level: str,
+    cache: ToolCache | None = None,
 ) -> dict:
     """Run all tools against a single bug and return its summary row.
 
@@ -603,7 +662,9 @@ def _process_one_bug(
             )
 
     tool_registry = resolve_tools(tools)
-    results = execute_tools(tool_registry, input_paths, bug_output_dir, timeout)
+    results = execute_tools(
+        tool_registry, input_paths, bug_output_dir, timeout, cache
+    )
 
     for tool_name, tool_instance in tool_registry.items():
         if tool_name not in results:
@@ -654,6 +715,7 @@ def _zkbugs_both(
     random_bugs: int | None,
     random_seed: int | None,
     log_level: str,
+    cache: ToolCache | None,
 ) -> None:
     """Run direct for every bug, then original only for bugs with a
     distinct Original Entrypoint. Emits <output>/{direct,original}/
@@ -679,6 +741,7 @@ def _zkbugs_both(
         random_bugs=random_bugs,
         random_seed=random_seed,
         log_level=log_level,
+        cache=cache,
     )
 
     # Determine which of the processed bugs have a distinct original
@@ -738,6 +801,7 @@ def _zkbugs_both(
             random_bugs=None,
             random_seed=random_seed,
             log_level=log_level,
+            cache=cache,
         )
         original_summary_path = original_out / "summary.json"
         try:
@@ -802,6 +866,7 @@ def zkbugs_mode(
     random_bugs: int | None = None,
     random_seed: int | None = None,
     log_level: str = "INFO",
+    cache: ToolCache | None = None,
 ) -> None:
     """Evaluate tools against the refactored zkbugs dataset."""
     if mode == "both":
@@ -816,6 +881,7 @@ def zkbugs_mode(
             random_bugs,
             random_seed,
             log_level,
+            cache,
         )
         return
 
@@ -910,6 +976,7 @@ def zkbugs_mode(
                         needs_artifacts,
                         in_worker=False,
                         log_level=log_level,
+                        cache=cache,
                     )
                 )
             except Exception as exc:  # noqa: BLE001
@@ -946,6 +1013,7 @@ def zkbugs_mode(
                     needs_artifacts,
                     True,
                     log_level,
+                    cache,
                 ): bug
                 for bug in runnable
             }
@@ -1044,11 +1112,8 @@ def vanilla_mode(output_dir: Path, eval: bool, dsl: str = "circom") -> None:
         logging.info(f"Processing bug: {bug_dir}")
         bug_name = bug_dir.name
         # Find all tool directories in the bug directory
-        tool_dirs = [
-            Path(bug_dir) / d
-            for d in os.listdir(bug_dir)
-            if (Path(bug_dir) / d).is_dir()
-        ]
+        with os.scandir(bug_dir) as entries:
+            tool_dirs = [Path(e.path) for e in entries if e.is_dir()]
         for tool_dir in tool_dirs:
             tool_name = tool_dir.name
             logging.info(f"Processing tool: {tool_name}")
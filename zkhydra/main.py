@@ -12,26 +12,29 @@ from datetime import datetime
 
 from zkhydra.cli import parse_args
 from zkhydra.core import (
-    AVAILABLE_TOOLS,
     analyze_mode,
     evaluate_mode,
+    expand_tools_list,
     load_bug_selectors,
     vanilla_mode,
     zkbugs_mode,
 )
 from zkhydra.utils.logger import setup_logging
+from zkhydra.utils.tool_cache import ToolCache
 
 
 def main() -> None:
     """Main entry point for zkHydra."""
     args = parse_args()
+    # Computed once so the log and output directories of a run always agree
+    args.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     # Setup logging based on mode
     if args.mode == "zkbugs":
         # For zkbugs mode, use the output directory name directly (no timestamp)
         output_dir = args.output
     else:
-        output_dir = args.output / datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_dir = args.output / args.timestamp
 
     setup_logging(args.log_level, output_dir, args.log_file)
 
@@ -40,12 +43,12 @@ def main() -> None:
     # Validate tools list
     tools_list = []
     if not args.vanilla:
-        tools_list = args.tools.split(",")
+        tools_list = expand_tools_list(args.tools, args.dsl)
         if not tools_list:
             logging.error("No tools specified")
             sys.exit(1)
-        if "all" in tools_list:
-            tools_list = AVAILABLE_TOOLS[args.dsl]
+
+    cache = None if args.no_cache else ToolCache(args.cache_dir)
 
     try:
         if args.vanilla:
@@ -63,6 +66,7 @@ def main() -> None:
                 random_bugs=args.random_bugs,
                 random_seed=args.random_seed,
                 log_level=args.log_level,
+                cache=cache,
             )
         elif args.mode == "analyze":
             is_tolm_file = args.input.suffix == ".tolm"
@@ -72,7 +76,13 @@ def main() -> None:
                 logging.error(f"Input file is not a circuit file: {args.input}")
                 sys.exit(1)
             analyze_mode(
-                args.input, tools_list, args.dsl, args.timeout, args.output
+                args.input,
+                tools_list,
+                args.dsl,
+                args.timeout,
+                args.output,
+                args.timestamp,
+                cache,
             )
         else:  # evaluate mode
             is_tolm_file = args.input.suffix == ".tolm"
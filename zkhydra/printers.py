@@ -4,6 +4,8 @@ Output formatting and display functions for zkHydra.
 This module handles all console output formatting and summary printing.
 """
 
+import sys
+
 
 def print_analyze_summary(summary: dict) -> None:
     """Print formatted summary for analyze mode.
@@ -17,27 +19,29 @@ def print_analyze_summary(summary: dict) -> None:
             - statistics: Dict with tool execution statistics
             - tools: Dict mapping tool names to their results
     """
-    print("\n" + "=" * 80)
-    print("ANALYZE MODE - SUMMARY")
-    print("=" * 80)
-    print(f"Input:          {summary['input']}")
-    print(f"Output:         {summary['output_directory']}")
-    print(f"Total Time:     {summary['total_execution_time']:.2f}s")
-    print(f"Total Findings: {summary['total_findings']}")
+    lines: list[str] = [
+        "\n" + "=" * 80,
+        "ANALYZE MODE - SUMMARY",
+        "=" * 80,
+        f"Input:          {summary['input']}",
+        f"Output:         {summary['output_directory']}",
+        f"Total Time:     {summary['total_execution_time']:.2f}s",
+        f"Total Findings: {summary['total_findings']}",
+    ]
 
     stats = summary.get("statistics", {})
     if stats:
-        print("\n" + "-" * 80)
-        print("STATISTICS:")
-        print("-" * 80)
-        print(f"Total Tools:  {stats.get('total_tools', 0)}")
-        print(f"Success:      {stats.get('success', 0)}")
-        print(f"Failed:       {stats.get('failed', 0)}")
-        print(f"Timeout:      {stats.get('timeout', 0)}")
-
-    print("\n" + "-" * 80)
-    print("TOOL RESULTS:")
-    print("-" * 80)
+        lines += [
+            "\n" + "-" * 80,
+            "STATISTICS:",
+            "-" * 80,
+            f"Total Tools:  {stats.get('total_tools', 0)}",
+            f"Success:      {stats.get('success', 0)}",
+            f"Failed:       {stats.get('failed', 0)}",
+            f"Timeout:      {stats.get('timeout', 0)}",
+        ]
+
+    lines += ["\n" + "-" * 80, "TOOL RESULTS:", "-" * 80]
 
     for tool_name, result in summary["tools"].items():
         status = result.get("status", "unknown")
@@ -51,30 +55,38 @@ def print_analyze_summary(summary: dict) -> None:
 
         status_text = status.upper()
 
-        print(f"\n{tool_name.upper()}: {status_symbol} {status_text}")
-        print(f"  Time:     {result['execution_time']}s")
-        print(f"  Raw Output:   {result.get('raw_output_file', 'N/A')}")
-        print(f"  Parsed Output:   {result.get('parsed_output_file', 'N/A')}")
-        print(f"  Uniformed Results:   {result.get('results_file', 'N/A')}")
+        lines += [
+            f"\n{tool_name.upper()}: {status_symbol} {status_text}",
+            f"  Time:     {result['execution_time']:.2f}s",
+            f"  Raw Output:   {result.get('raw_output_file', 'N/A')}",
+            f"  Parsed Output:   {result.get('parsed_output_file', 'N/A')}",
+            f"  Uniformed Results:   {result.get('results_file', 'N/A')}",
+        ]
         if status == "success":
-            print(f"  Findings: {result['findings_count']}")
+            lines.append(f"  Findings: {result['findings_count']}")
 
             if result.get("findings"):
-                print("\n  Findings List:")
+                lines.append("\n  Findings List:")
                 for idx, finding in enumerate(
                     result["findings"][:10], 1
                 ):  # Show first 10
                     desc = finding.get(
                         "description", finding.get("type", "Unknown")
                     )
-                    print(f"    {idx}. {desc}")
+                    lines.append(f"    {idx}. {desc}")
                 if result["findings_count"] > 10:
-                    print(f"    ... and {result['findings_count'] - 10} more")
+                    lines.append(
+                        f"    ... and {result['findings_count'] - 10} more"
+                    )
 
         elif status == "failed":
-            print(f"  Error:    {result.get('error', 'Unknown error')}")
+            lines.append(f"  Error:    {result.get('error', 'Unknown error')}")
 
         elif status == "timeout":
-            print("  Status:   Tool execution timed out")
+            lines.append("  Status:   Tool execution timed out")
+
+    lines.append("\n" + "=" * 80)
 
-    print("\n" + "=" * 80)
+    # Emit the whole summary with a single write instead of one per line
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
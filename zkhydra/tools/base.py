@@ -5,31 +5,42 @@ This module provides the abstract base class that all analysis tools must implem
 along with common utilities for tool execution and output handling.
 """
 
-import json
+import functools
 import logging
 import os
+import re
 import shlex
 import shutil
 import subprocess
+import tempfile
 import time
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum, StrEnum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-
-EXIT_CODES = {
-    1,  # General error: A generic error occurred during execution.
-    2,  # Misuse of shell builtins: Incorrect usage of a shell built-in command.
-    126,  # Command invoked cannot execute: Permission denied or command not executable.
-    127,  # Command not found: The command is not recognized or available in the environment’s PATH.
-    128,  # Invalid exit argument: An invalid argument was provided to the exit command.
-    130,  # Script terminated by Ctrl+C (SIGINT).
-    137,  # Script terminated by SIGKILL (e.g., kill -9 or out-of-memory killer).
-    139,  # Segmentation fault: Indicates a segmentation fault occurred in the program.
-    143,  # Script terminated by SIGTERM (e.g., kill command without -9).
-    255,  # Exit status out of range: Typically, this happens when a script or command exits with a number > 255.
-}
+from types import MappingProxyType
+from typing import Any, BinaryIO, ClassVar, Dict, List, Optional, Tuple
+
+from zkhydra.utils.json_io import read_json, write_json
+
+EXIT_CODES: frozenset[int] = frozenset(
+    {
+        1,  # General error: A generic error occurred during execution.
+        2,  # Misuse of shell builtins: Incorrect usage of a shell built-in command.
+        126,  # Command invoked cannot execute: Permission denied or command not executable.
+        127,  # Command not found: The command is not recognized or available in the environment’s PATH.
+        128,  # Invalid exit argument: An invalid argument was provided to the exit command.
+        130,  # Script terminated by Ctrl+C (SIGINT).
+        137,  # Script terminated by SIGKILL (e.g., kill -9 or out-of-memory killer).
+        139,  # Segmentation fault: Indicates a segmentation fault occurred in the program.
+        143,  # Script terminated by SIGTERM (e.g., kill command without -9).
+        255,  # Exit status out of range: Typically, this happens when a script or command exits with a number > 255.
+    }
+)
+
+# First line of the raw output file, followed by the tool's stdout
+_STDOUT_HEADER = b"stdout:\n"
 
 
 class ToolError(Exception):
@@ -53,7 +64,7 @@ class StandardizedBugCategory(StrEnum):
     WARNING = "Warning (Other -- probably not a bug)"
 
 
-@dataclass
+@dataclass(slots=True)
 class Input:
     """Input paths and link contract for a circuit analysis run.
 
@@ -77,6 +88,35 @@ class Input:
     sym_file: Optional[str] = None
 
 
+# Matches: include "path"; or include 'path'; (ignoring // line comments).
+# Shared by circuit discovery and the tool cache so both agree on what
+# counts as an include.
+INCLUDE_RE = re.compile(r'^\s*include\s+["\']([^"\']+)["\']\s*;', re.MULTILINE)
+
+# circom flags whose argument is a library directory
+LINK_LIBRARY_FLAGS = frozenset({"-l", "-L", "--link-libraries"})
+
+
+def extract_link_paths(link_flags: List[str]) -> List[str]:
+    """Return the library directories named in a circom link flag list.
+
+    Args:
+        link_flags: Flags as passed to circom (e.g. ["-l", "<dir>"])
+
+    Returns:
+        Library directories, in the order they were given
+    """
+    paths: List[str] = []
+    it = iter(link_flags)
+    for flag in it:
+        if flag in LINK_LIBRARY_FLAGS:
+            try:
+                paths.append(next(it))
+            except StopIteration:
+                break
+    return paths
+
+
 class OutputStatus(Enum):
     """Status of tool execution output."""
 
@@ -94,55 +134,68 @@ class AnalysisStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolOutput:
     """Output from tool execution.
 
-    Encapsulates all information from running a tool, including
-    status, stdout/stderr, return code, and combined message.
+    Encapsulates the status, return code and a short message from running a
+    tool. The tool's stdout/stderr are streamed straight to raw_output_file
+    instead of being kept in memory.
     """
 
     status: OutputStatus  # Execution status
-    stdout: str  # Standard output from the tool
-    stderr: str  # Standard error from the tool
     return_code: int  # Process return code
-    msg: str  # Combined stdout + stderr message (or other costum message)
-    execution_time: Optional[float] = None  # Execution time in seconds
+    msg: str  # Short status message (or other costum message)
+    execution_time_ns: Optional[int] = None  # Execution time in nanoseconds
     raw_output_file: Optional[str] = None  # Path to raw output file
+    byte_len: int = 0  # Size of the raw output in bytes
     parsed_output_file: Optional[str] = None  # Path to parsed output file
     results_file: Optional[str] = None  # Path to results file
+    cached: bool = False  # Restored from the tool cache instead of run
 
     def to_dict(self) -> dict:
         """Convert ToolOutput to dictionary for JSON serialization."""
         return {
             "status": self.status.value,
-            "stdout": self.stdout,
-            "stderr": self.stderr,
             "return_code": self.return_code,
             "msg": self.msg,
             "execution_time": self.execution_time,
+            "execution_time_ns": self.execution_time_ns,
             "raw_output_file": self.raw_output_file,
+            "byte_len": self.byte_len,
             "parsed_output_file": self.parsed_output_file,
             "results_file": self.results_file,
+            "cached": self.cached,
         }
 
+    @property
+    def execution_time(self) -> Optional[float]:
+        """Execution time in seconds."""
+        if self.execution_time_ns is None:
+            return None
+        return self.execution_time_ns / 1e9
+
     @classmethod
     def from_dict(cls, data: dict) -> "ToolOutput":
         """Create ToolOutput from dictionary."""
+        execution_time_ns = data.get("execution_time_ns")
+        if execution_time_ns is None and data.get("execution_time") is not None:
+            # Written before execution times were recorded in nanoseconds
+            execution_time_ns = round(data["execution_time"] * 1e9)
         return cls(
             status=OutputStatus(data["status"]),
-            stdout=data["stdout"],
-            stderr=data["stderr"],
             return_code=data["return_code"],
             msg=data["msg"],
-            execution_time=data.get("execution_time"),
+            execution_time_ns=execution_time_ns,
             raw_output_file=data.get("raw_output_file"),
+            byte_len=data.get("byte_len", 0),
             parsed_output_file=data.get("parsed_output_file"),
             results_file=data.get("results_file"),
+            cached=data.get("cached", False),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     """Unified finding/vulnerability from a security analysis tool.
 
@@ -213,23 +266,31 @@ class ToolStatus(Enum):
     TIMEOUT = "timeout"
 
 
-@dataclass
+# AnalysisStatus values that map to a ToolStatus other than SUCCESS
+_ANALYSIS_TO_TOOL_STATUS = {
+    AnalysisStatus.TIMEOUT: ToolStatus.TIMEOUT,
+    AnalysisStatus.ERROR: ToolStatus.FAILED,
+}
+
+
+@dataclass(slots=True)
 class ToolResult:
     """Result of tool execution."""
 
     status: ToolStatus
-    message: str  # Combined stdout and stderr
-    execution_time: float
+    message: str  # Short status message from the tool
+    execution_time_ns: int  # Execution time in nanoseconds
     findings_count: int = 0
-    findings: list[dict] = None
+    findings: list[Finding] = field(default_factory=list)
     error: str | None = None
     raw_output_file: str | None = None
     parsed_output_file: str | None = None
     results_file: str | None = None
 
-    def __post_init__(self):
-        if self.findings is None:
-            self.findings = []
+    @property
+    def execution_time(self) -> float:
+        """Execution time in seconds."""
+        return self.execution_time_ns / 1e9
 
     def to_dict(self) -> dict:
         """Convert ToolResult to dictionary for JSON serialization."""
@@ -238,7 +299,7 @@ class ToolResult:
             "message": self.message,
             "execution_time": self.execution_time,
             "findings_count": self.findings_count,
-            "findings": self.findings,
+            "findings": [f.to_dict() for f in self.findings],
             "error": self.error,
             "raw_output_file": self.raw_output_file,
             "parsed_output_file": self.parsed_output_file,
@@ -246,13 +307,16 @@ class ToolResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ResultsData:
     """Data for results.json file."""
 
     status: AnalysisStatus
     execution_time: float
     findings: list[Finding]
+    # Set when the run was restored from the tool cache; execution_time is
+    # then the restore time, not the tool's
+    cached: bool = False
 
     def to_dict(self) -> dict:
         """Convert ResultsData to dictionary for JSON serialization."""
@@ -260,6 +324,7 @@ class ResultsData:
             "status": self.status.value,
             "execution_time": self.execution_time,
             "findings": [f.to_dict() for f in self.findings],
+            "cached": self.cached,
         }
 
     @classmethod
@@ -269,6 +334,7 @@ class ResultsData:
             status=AnalysisStatus(data["status"]),
             execution_time=data["execution_time"],
             findings=[Finding.from_dict(f) for f in data["findings"]],
+            cached=data.get("cached", False),
         )
 
 
@@ -279,6 +345,13 @@ class AbstractTool(ABC):
     the three required methods: execute, parse_output, and compare_zkbugs_ground_truth.
     """
 
+    # Exit codes that mark a run as failed; tools may override this.
+    exit_codes: ClassVar[frozenset[int]] = EXIT_CODES
+    # Arguments the tool is always run with, beyond the circuit and link
+    # flags. Part of the result cache key, so changing them invalidates
+    # cached runs.
+    fixed_args: ClassVar[Tuple[str, ...]] = ()
+
     def __init__(self, name: str):
         """Initialize the tool with its name.
 
@@ -286,7 +359,6 @@ class AbstractTool(ABC):
             name: The name of the tool (e.g., "circomspect", "zkfuzz")
         """
         self.name = name
-        self.exit_codes = EXIT_CODES
 
     def execute(
         self, input_paths: Input, timeout: int, raw_output_file: Path
@@ -299,43 +371,52 @@ class AbstractTool(ABC):
             raw_output_file: Path to file to write raw output to
 
         Returns:
-            ToolOutput object with status, stdout, stderr, return_code, and msg
+            ToolOutput object with status, return_code, msg and byte_len
 
         Note:
             Tools can choose to use either input_paths.circuit_dir or
             input_paths.circuit_file based on their requirements.
         """
-        # Measure execution time
-        start_time = time.time()
-        tool_output = self._internal_execute(input_paths, timeout)
-        execution_time = time.time() - start_time
-        # Write raw output (msg field contains combined stdout/stderr)
-        with open(raw_output_file, "w", encoding="utf-8") as f:
-            f.write(tool_output.msg)
-        tool_output = ToolOutput(
-            status=tool_output.status,
-            stdout=tool_output.stdout,
-            stderr=tool_output.stderr,
-            return_code=tool_output.return_code,
-            msg=tool_output.msg,
-            execution_time=execution_time,
-            raw_output_file=str(raw_output_file),
+        # Measure execution time. Tools stream their output straight into
+        # raw_output_file; make it absolute as some tools run in another
+        # working directory. perf_counter_ns is immune to wall-clock
+        # adjustments during a run.
+        start_ns = time.perf_counter_ns()
+        tool_output = self._internal_execute(
+            input_paths, timeout, raw_output_file.absolute()
         )
+        tool_output.execution_time_ns = time.perf_counter_ns() - start_ns
+        tool_output.raw_output_file = str(raw_output_file)
         tool_output_file = raw_output_file.parent / "tool_output.json"
-        with open(tool_output_file, "w", encoding="utf-8") as f:
-            json.dump(tool_output.to_dict(), f, indent=2, ensure_ascii=False)
+        write_json(tool_output_file, tool_output.to_dict())
         return tool_output
 
+    def cache_dependencies(self) -> List[str]:
+        """Executables whose changes invalidate cached results of this tool.
+
+        Tools whose output is fully determined by the circuit and these
+        executables override this to opt into the result cache. Entries
+        are looked up in PATH unless they contain a directory part.
+
+        Returns:
+            List of executable names/paths, empty if results must not be
+            cached
+        """
+        return []
+
     @abstractmethod
-    def _internal_execute(self, input_paths: Input, timeout: int) -> ToolOutput:
+    def _internal_execute(
+        self, input_paths: Input, timeout: int, raw_output_file: Path
+    ) -> ToolOutput:
         """Internal execute method that can be overridden by subclasses.
 
         Args:
             input_paths: Input object containing circuit_dir and circuit_file paths
             timeout: Maximum execution time in seconds
+            raw_output_file: Path to file to stream raw output to
 
         Returns:
-            ToolOutput object with status, stdout, stderr, return_code, and msg
+            ToolOutput object with status, return_code, msg and byte_len
         """
         pass
 
@@ -375,7 +456,7 @@ class AbstractTool(ABC):
         It will also generate a findings.json file that contains the findings of the tool in the standardized format.
 
         Args:
-            tool_output: ToolOutput object with status, stdout, stderr, return_code, and msg
+            tool_output: ToolOutput object with status, return_code, msg and byte_len
 
         Returns:
             ToolResult object with status, message, execution_time, findings_count, findings, error, and raw_output_file
@@ -383,45 +464,25 @@ class AbstractTool(ABC):
         result = None
         try:
             # Check tool execution status
-            if tool_output.status == OutputStatus.TIMEOUT:
-                result = ToolResult(
-                    status=ToolStatus.TIMEOUT,
-                    message=tool_output.msg,
-                    execution_time=tool_output.execution_time,
-                    findings_count=0,
-                    findings=[],
-                    raw_output_file=str(tool_output.raw_output_file),
-                )
-            elif tool_output.status == OutputStatus.FAIL:
-                # Tool failed (binary not found, file not found, etc.)
-                result = ToolResult(
-                    status=ToolStatus.FAILED,
-                    message=tool_output.msg,
-                    execution_time=tool_output.execution_time,
-                    findings_count=0,
-                    findings=[],
-                    error=tool_output.msg,
-                    raw_output_file=str(tool_output.raw_output_file),
-                )
-                logging.error(f"{self.name}: {tool_output.msg}")
-            else:
+            if tool_output.status is OutputStatus.SUCCESS:
                 # Success - parse findings from output
                 try:
 
                     # Since it succeeded, we can generate the parsed.json file
                     raw_output_path = Path(tool_output.raw_output_file)
+                    output_dir = raw_output_path.parent
+                    parsed_output_file = output_dir / "parsed.json"
+                    results_file = output_dir / "results.json"
                     parsed_output = self._helper_parse_output(raw_output_path)
-                    parsed_output_file = raw_output_path.parent / "parsed.json"
 
-                    # Serialize dataclass if it has to_dict method, otherwise use as-is
+                    # Parsers return a dataclass with to_dict, or a plain dict
                     output_data = (
-                        parsed_output.to_dict()
-                        if hasattr(parsed_output, "to_dict")
-                        else parsed_output
+                        parsed_output
+                        if isinstance(parsed_output, dict)
+                        else parsed_output.to_dict()
                     )
 
-                    with open(parsed_output_file, "w", encoding="utf-8") as f:
-                        json.dump(output_data, f, indent=4)
+                    write_json(parsed_output_file, output_data)
 
                     # Generate uniform findings
                     analysis_status, findings = (
@@ -431,41 +492,31 @@ class AbstractTool(ABC):
                     )
 
                     # Generate results.json with uniform findings
-                    results_file = raw_output_path.parent / "results.json"
                     results_data = ResultsData(
                         status=analysis_status,
-                        execution_time=round(tool_output.execution_time, 2),
+                        execution_time=tool_output.execution_time,
                         findings=findings,
+                        cached=tool_output.cached,
                     )
-                    with open(results_file, "w", encoding="utf-8") as f:
-                        json.dump(
-                            results_data.to_dict(),
-                            f,
-                            indent=2,
-                            ensure_ascii=False,
-                        )
-
-                    # Convert Finding objects to dictionaries for JSON serialization
-                    findings_dicts = [f.to_dict() for f in findings]
+                    write_json(results_file, results_data.to_dict())
 
-                    # Map AnalysisStatus to ToolStatus
-                    if analysis_status == AnalysisStatus.TIMEOUT:
-                        tool_status = ToolStatus.TIMEOUT
-                    elif analysis_status == AnalysisStatus.ERROR:
-                        tool_status = ToolStatus.FAILED
-                    else:
-                        tool_status = ToolStatus.SUCCESS
+                    tool_status = _ANALYSIS_TO_TOOL_STATUS.get(
+                        analysis_status, ToolStatus.SUCCESS
+                    )
 
                     logging.info(
-                        f"{self.name}: Found {len(findings)} findings in {tool_output.execution_time:.2f}s"
+                        "%s: Found %d findings in %.2fs",
+                        self.name,
+                        len(findings),
+                        tool_output.execution_time,
                     )
                     result = ToolResult(
                         status=tool_status,
                         message=tool_output.msg,
-                        execution_time=round(tool_output.execution_time, 2),
+                        execution_time_ns=tool_output.execution_time_ns,
                         findings_count=len(findings),
-                        findings=findings_dicts,
-                        raw_output_file=str(tool_output.raw_output_file),
+                        findings=findings,
+                        raw_output_file=tool_output.raw_output_file,
                         parsed_output_file=str(parsed_output_file),
                         results_file=str(results_file),
                     )
@@ -473,11 +524,32 @@ class AbstractTool(ABC):
                     result = ToolResult(
                         status=ToolStatus.FAILED,
                         message=tool_output.msg,
-                        execution_time=tool_output.execution_time,
+                        execution_time_ns=tool_output.execution_time_ns,
                         findings_count=0,
                         findings=[],
                         error=str(e),
                     )
+            elif tool_output.status is OutputStatus.TIMEOUT:
+                result = ToolResult(
+                    status=ToolStatus.TIMEOUT,
+                    message=tool_output.msg,
+                    execution_time_ns=tool_output.execution_time_ns,
+                    findings_count=0,
+                    findings=[],
+                    raw_output_file=tool_output.raw_output_file,
+                )
+            else:
+                # Tool failed (binary not found, file not found, etc.)
+                result = ToolResult(
+                    status=ToolStatus.FAILED,
+                    message=tool_output.msg,
+                    execution_time_ns=tool_output.execution_time_ns,
+                    findings_count=0,
+                    findings=[],
+                    error=tool_output.msg,
+                    raw_output_file=tool_output.raw_output_file,
+                )
+                logging.error(f"{self.name}: {tool_output.msg}")
         except Exception as e:
             # Let it crash here because we want to see the full traceback
             # and should never be raised an exception here
@@ -532,7 +604,7 @@ class AbstractTool(ABC):
         Returns:
             True if binary exists in PATH, False otherwise
         """
-        if shutil.which(binary_name) is None:
+        if which(binary_name) is None:
             logging.error(f"'{binary_name}' CLI not found in PATH")
             return False
         return True
@@ -553,85 +625,152 @@ class AbstractTool(ABC):
             return output.decode("utf-8", errors="replace")
         return output
 
+    @staticmethod
+    def _write_timed_out(out: BinaryIO, err: BinaryIO) -> int:
+        """Rewrite the raw output of a timed-out run.
+
+        The marker comes first, followed by the partial output:
+        "[Timed out]\nPartial stdout:\n...\nPartial stderr:\n...", or just
+        "[Timed out]" if the tool printed nothing. Timeouts are rare, so the
+        stdout already streamed to out is moved through a temporary file.
+
+        Args:
+            out: Raw output file, holding the header and streamed stdout
+            err: Spooled stderr
+
+        Returns:
+            Size of the raw output in bytes
+        """
+        with tempfile.TemporaryFile() as partial_stdout:
+            out.seek(len(_STDOUT_HEADER))
+            shutil.copyfileobj(out, partial_stdout)
+            has_output = (
+                partial_stdout.tell() > 0 or os.fstat(err.fileno()).st_size > 0
+            )
+            out.seek(0)
+            out.truncate()
+            out.write(b"[Timed out]")
+            if has_output:
+                out.write(b"\nPartial stdout:\n")
+                partial_stdout.seek(0)
+                shutil.copyfileobj(partial_stdout, out)
+                out.write(b"\nPartial stderr:\n")
+                err.seek(0)
+                shutil.copyfileobj(err, out)
+        return out.tell()
+
+    @classmethod
+    def _read_tail(
+        cls, path: Path, byte_len: int, max_bytes: int = 4096
+    ) -> str:
+        """Read (at most) the last max_bytes of a raw output file.
+
+        Args:
+            path: Path to the raw output file
+            byte_len: Size of the file in bytes
+            max_bytes: Maximum number of bytes to read
+
+        Returns:
+            Decoded tail of the file
+        """
+        with open(path, "rb") as f:
+            f.seek(max(0, byte_len - max_bytes))
+            return cls._decode_output(f.read())
+
     def run_command(
-        self, cmd: list[str], timeout: int, bug_path: str
+        self,
+        cmd: list[str],
+        timeout: int,
+        bug_path: str,
+        raw_output_file: Path,
+        cwd: Optional[Path] = None,
     ) -> ToolOutput:
-        """Run a subprocess command and return structured output.
+        """Run a subprocess command, streaming its output to a file.
+
+        stdout is written straight to raw_output_file and stderr is spooled
+        to a temporary file that is appended once the process exits, so the
+        raw file keeps the "stdout:\n...\nstderr:\n..." layout without the
+        output ever being buffered in memory. A timed-out run is rewritten
+        with the "[Timed out]" marker first (see _write_timed_out).
 
         Args:
             cmd: Command and arguments as list
             timeout: Timeout in seconds
             bug_path: Path being analyzed (for logging)
+            raw_output_file: Path to file to stream raw output to
+            cwd: Working directory for the command (default: current one)
 
         Returns:
-            ToolOutput object with status, stdout, stderr, return_code, and msg
+            ToolOutput object with status, return_code, msg and byte_len
         """
-        logging.info(f"Running: '{shlex.join(cmd)}'")
-
-        try:
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, check=True, timeout=timeout
-            )
-            stdout = result.stdout or ""
-            stderr = result.stderr or ""
-            msg = f"stdout:\n{stdout}\nstderr:\n{stderr}"
-
-            return ToolOutput(
-                status=OutputStatus.SUCCESS,
-                stdout=stdout,
-                stderr=stderr,
-                return_code=result.returncode,
-                msg=msg,
-            )
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            logging.info("Running: '%s'", shlex.join(cmd))
+
+        timed_out = False
+        # Unbuffered, so our writes and the child's share one file offset
+        with (
+            open(raw_output_file, "w+b", buffering=0) as out,
+            tempfile.TemporaryFile() as err,
+        ):
+            out.write(_STDOUT_HEADER)
+            process = subprocess.Popen(cmd, stdout=out, stderr=err, cwd=cwd)
+            try:
+                return_code = process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                return_code = -1
+                timed_out = True
+            except BaseException:
+                # As subprocess.run does: never leave the child running on
+                # any other exception, including KeyboardInterrupt.
+                process.kill()
+                process.wait()
+                raise
+
+            if timed_out:
+                byte_len = self._write_timed_out(out, err)
+            else:
+                out.write(b"\nstderr:\n")
+                err.seek(0)
+                shutil.copyfileobj(err, out)
+                byte_len = out.tell()
 
-        except subprocess.TimeoutExpired as e:
-            stdout = self._decode_output(getattr(e, "stdout", None))
-            stderr = self._decode_output(getattr(e, "stderr", None))
+        if timed_out:
             logging.warning(
                 f"Process for '{self.name}' analysing '{bug_path}' exceeded {timeout} seconds and timed out. "
-                f"Partial output: {stdout}"
+                f"Partial output in: {raw_output_file}"
             )
-            msg = "[Timed out]"
-            if stdout or stderr:
-                msg += f"\nPartial stdout:\n{stdout}\nPartial stderr:\n{stderr}"
-
             return ToolOutput(
                 status=OutputStatus.TIMEOUT,
-                stdout=stdout,
-                stderr=stderr,
                 return_code=-1,
-                msg=msg,
+                msg="[Timed out]",
+                byte_len=byte_len,
             )
 
-        except subprocess.CalledProcessError as e:
-            stdout = self._decode_output(e.stdout)
-            stderr = self._decode_output(e.stderr)
-            # Some tools (e.g., circomspect) return non-zero exit codes by design
-            # but still produce valid output. Return SUCCESS status so output can be parsed.
-            # Manually handle all standard linux exit codes
-            if e.returncode in self.exit_codes:
-                logging.warning(
-                    f"Process for '{self.name}' analysing '{bug_path}' failed with exit code {e.returncode}. "
-                    f"Partial output: {stdout}"
-                )
-                return ToolOutput(
-                    status=OutputStatus.FAIL,
-                    stdout=stdout,
-                    stderr=stderr,
-                    return_code=e.returncode,
-                    msg=f"stdout:\n{stdout}\nstderr:\n{stderr}",
-                )
-
-            msg = f"stdout:\n{stdout}\nstderr:\n{stderr}"
-
+        # Some tools (e.g., circomspect) return non-zero exit codes by design
+        # but still produce valid output. Return SUCCESS status so output can be parsed.
+        # Manually handle all standard linux exit codes
+        if return_code in self.exit_codes:
+            tail = self._read_tail(raw_output_file, byte_len)
+            logging.warning(
+                f"Process for '{self.name}' analysing '{bug_path}' failed with exit code {return_code}. "
+                f"Output tail: {tail}"
+            )
             return ToolOutput(
-                status=OutputStatus.SUCCESS,
-                stdout=stdout,
-                stderr=stderr,
-                return_code=e.returncode,
-                msg=msg,
+                status=OutputStatus.FAIL,
+                return_code=return_code,
+                msg=f"[Exit code {return_code}]\n{tail}",
+                byte_len=byte_len,
             )
 
+        return ToolOutput(
+            status=OutputStatus.SUCCESS,
+            return_code=return_code,
+            msg=f"[Exit code {return_code}]",
+            byte_len=byte_len,
+        )
+
     def check_files_exist(self, *files: Path) -> bool:
         """Check if all provided files exist.
 
@@ -650,31 +789,34 @@ class AbstractTool(ABC):
                 return False
         return True
 
-    def load_json_file(self, file_path: Path) -> Dict[str, Any]:
+    def load_json_file(
+        self, file_path: Path, cache: bool = False
+    ) -> Mapping[str, Any]:
         """Load and parse a JSON file.
 
+        With cache=True the parsed file is cached by (path, mtime, size), so
+        the ground truth shared by all tools of a bug is only parsed once.
+        The result is then read-only as it is shared between callers.
+
         Args:
             file_path: Path to JSON file
+            cache: Reuse the parsed file across calls (for ground truth)
 
         Returns:
-            Parsed JSON as dictionary, or empty dict on error
+            Parsed JSON (a read-only mapping if cached), or empty dict on
+            error
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            if not cache:
+                return read_json(file_path)
+            st = os.stat(file_path)
+            return _read_json_cached(
+                os.fspath(file_path), st.st_mtime_ns, st.st_size
+            )
         except Exception as e:
             logging.error(f"Failed to read JSON file '{file_path}': {e}")
             return {}
 
-    def change_directory(self, target_dir: Path) -> None:
-        """Change current working directory.
-
-        Args:
-            target_dir: Target directory path
-        """
-        os.chdir(target_dir)
-        logging.debug(f"Changed directory to: {Path.cwd()}")
-
 
 # Utility functions that are used across the codebase
 
@@ -684,6 +826,27 @@ def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+def which(binary_name: str) -> str | None:
+    """Cached shutil.which; a binary is looked up once per PATH value."""
+    return _which(binary_name, os.environ.get("PATH", os.defpath))
+
+
+@functools.lru_cache(maxsize=256)
+def _which(binary_name: str, path: str) -> str | None:
+    """shutil.which against an explicit PATH, which is part of the key."""
+    return shutil.which(binary_name, path=path)
+
+
+# Only ground-truth files go through this cache, and all tools of a bug read
+# the same one in a row, so a few entries suffice.
+@functools.lru_cache(maxsize=8)
+def _read_json_cached(
+    path: str, mtime_ns: int, size: int
+) -> MappingProxyType[str, Any]:
+    """Parse a JSON file; mtime_ns and size only serve as cache key."""
+    return MappingProxyType(read_json(path))
+
+
 def get_tool_result_parsed(tool_result_parsed: Path) -> dict:
     """Read a parsed tool result file and return the data.
 
@@ -694,8 +857,7 @@ def get_tool_result_parsed(tool_result_parsed: Path) -> dict:
         Parsed JSON data, or empty dict on error
     """
     try:
-        with open(tool_result_parsed, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = read_json(tool_result_parsed)
     except Exception as e:
         logging.error(
             f"Failed to read parsed tool result '{tool_result_parsed}': {e}"
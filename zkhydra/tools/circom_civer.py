@@ -14,6 +14,7 @@ from .base import (
     StandardizedBugCategory,
     ToolOutput,
     get_tool_result_parsed,
+    which,
 )
 
 # Mapping from circom_civer bug names to standardized categories
@@ -22,7 +23,39 @@ CIVER_TO_STANDARD = {
 }
 
 
-@dataclass
+# Patterns used to parse circom_civer's output
+_COMPONENT_RE = re.compile(r"-\s*([A-Za-z0-9_]+)\(([\d,\s]*)\)")
+_TRAILING_INT_RE = re.compile(r"(\d+)$")
+
+
+# Section headers and the context each of them opens
+_SECTION_HEADERS = {
+    "Components that do not satisfy weak safety": "buggy",
+    "Components timeout when checking weak-safety": "timeout",
+    "Components that satisfy weak safety": "verified",
+    "Components that failed verification": "failed",
+}
+_SECTION_PREFIXES = tuple(_SECTION_HEADERS)
+
+
+def _section_of(line: str) -> Optional[str]:
+    """Return the context a section header line opens, or None."""
+    # One C-level test rejects non-header lines before the per-prefix loop
+    if not line.startswith(_SECTION_PREFIXES):
+        return None
+    for prefix, section in _SECTION_HEADERS.items():
+        if line.startswith(prefix):
+            return section
+    return None
+
+
+def _trailing_int(text: str) -> Optional[int]:
+    """Return the integer a stats line ends with, or None."""
+    m = _TRAILING_INT_RE.search(text)
+    return int(m.group(1)) if m else None
+
+
+@dataclass(slots=True)
 class CiverComponent:
     """Represents a circuit component analyzed by circom_civer."""
 
@@ -37,7 +70,7 @@ class CiverComponent:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CiverParsed:
     """Structured parsed output from circom-civer tool.
 
@@ -70,19 +103,36 @@ class CiverParsed:
 class CircomCiver(AbstractTool):
     """Circom-civer formal verification tool for Circom circuits."""
 
+    fixed_args = (
+        "--check_safety",
+        "--verbose",
+        "--verification_timeout",
+        "500000",
+        "--O0",
+    )
+
     def __init__(self):
         super().__init__("circom_civer")
         # Check if civer_circom is in PATH
         if not self.check_binary_exists("civer_circom"):
             logging.error("[Binary not found: install civer_circom]")
             sys.exit(1)
+        # Resolved once, so the exec of each run skips the PATH search
+        self.civer_path = which("civer_circom")
+
+    def cache_dependencies(self) -> List[str]:
+        """civer_circom is a single static binary; cache on it."""
+        return ["civer_circom"]
 
-    def _internal_execute(self, input_paths: Input, timeout: int) -> ToolOutput:
+    def _internal_execute(
+        self, input_paths: Input, timeout: int, raw_output_file: Path
+    ) -> ToolOutput:
         """Run circom-civer on a given circuit.
 
         Args:
             input_paths: Input object containing circuit_dir and circuit_file paths
             timeout: Maximum execution time in seconds
+            raw_output_file: Path to file to stream raw output to
 
         Returns:
             ToolOutput object with execution results
@@ -90,16 +140,14 @@ class CircomCiver(AbstractTool):
         circuit_file_path = Path(input_paths.circuit_file)
 
         cmd = [
-            "civer_circom",
+            self.civer_path,
             str(circuit_file_path),
-            "--check_safety",
-            "--verbose",
-            "--verification_timeout",
-            "500000",
-            "--O0",
+            *self.fixed_args,
             *input_paths.link_flags,
         ]
-        return self.run_command(cmd, timeout, input_paths.circuit_dir)
+        return self.run_command(
+            cmd, timeout, input_paths.circuit_dir, raw_output_file
+        )
 
     def _helper_parse_output(
         self,
@@ -113,11 +161,6 @@ class CircomCiver(AbstractTool):
         Returns:
             CiverParsed object with structured data and uniform findings
         """
-        with open(tool_result_raw, "r", encoding="utf-8") as f:
-            bug_info: list[str] = [line.strip() for line in f if line.strip()]
-
-        structured_info: Dict[str, Any] = {}
-
         stats: Dict[str, Optional[int]] = {
             "verified": None,
             "failed": None,
@@ -129,68 +172,58 @@ class CircomCiver(AbstractTool):
 
         context: Optional[str] = None
 
-        # Helper function for stats parsing
-        def _safe_int_from_line(pattern: str, text: str) -> Optional[int]:
-            m = re.search(pattern, text)
-            if m:
-                try:
-                    return int(m.group(1))
-                except (ValueError, TypeError):
-                    return None
-            return None
-
-        for raw_line in bug_info:
-            line = (raw_line or "").strip()
-            if line == "[Timed out]":
-                context = "timeout"
-                # Keep empty lists for components
-                continue
-
-            # --- Track context (which section we are in) ---
-            if line.startswith("Components that do not satisfy weak safety"):
-                context = "buggy"
-                continue
-            elif line.startswith(
-                "Components timeout when checking weak-safety"
-            ):
-                context = "timeout"
-                continue
-            elif line.startswith("Components that satisfy weak safety"):
-                context = "verified"
-                continue
-            elif line.startswith("Components that failed verification"):
-                context = "failed"
-                continue
-            elif line == "":
-                context = None  # reset only on empty line
-                continue
-
-            # --- Match component lines ---
-            if line.startswith("-"):
-                comp_match = re.match(
-                    r"-\s*([A-Za-z0-9_]+)\(([\d,\s]*)\)", line
-                )
-                if comp_match:
-                    comp_name, numbers = comp_match.groups()
-                    nums = [
-                        int(n.strip()) for n in numbers.split(",") if n.strip()
-                    ]
-                    component = CiverComponent(name=comp_name, params=nums)
-
-                    if context == "buggy":
-                        buggy_components.append(component)
-                    elif context == "timeout":
-                        timed_out_components.append(component)
-                    elif context == "verified":
-                        verified_components.append(component)
-
-            # --- Stats parsing ---
-            if "Number of verified components" in line:
-                stats["verified"] = _safe_int_from_line(r"(\d+)$", line)
-            elif "Number of failed components" in line:
-                stats["failed"] = _safe_int_from_line(r"(\d+)$", line)
-            elif "Number of timeout components" in line:
-                stats["timeout"] = _safe_int_from_line(r"(\d+)$", line)
+        # Lines are parsed as they are read; blank lines are skipped and do
+        # not end a section.
+        with open(
+            tool_result_raw, "r", encoding="utf-8", buffering=1 << 20
+        ) as f:
+            for raw_line in f:
+                line = raw_line.strip()
+                if not line:
+                    continue
+                first = line[:1]
+
+                # --- Track context (which section we are in) ---
+                # Only lines starting with "[" or "C" can open a section.
+                if first == "[":
+                    if line == "[Timed out]":
+                        context = "timeout"
+                        # Keep empty lists for components
+                        continue
+                elif first == "C":
+                    section = _section_of(line)
+                    if section is not None:
+                        context = section
+                        continue
+
+                # --- Match component lines ---
+                if first == "-":
+                    comp_match = _COMPONENT_RE.match(line)
+                    if comp_match:
+                        comp_name, numbers = comp_match.groups()
+                        nums = [
+                            int(n.strip())
+                            for n in numbers.split(",")
+                            if n.strip()
+                        ]
+                        component = CiverComponent(name=comp_name, params=nums)
+
+                        if context == "buggy":
+                            buggy_components.append(component)
+                        elif context == "timeout":
+                            timed_out_components.append(component)
+                        elif context == "verified":
+                            verified_components.append(component)
+
+                # --- Stats parsing ---
+                if "Number of " not in line:
+                    continue
+                if "Number of verified components" in line:
+                    stats["verified"] = _trailing_int(line)
+                elif "Number of failed components" in line:
+                    stats["failed"] = _trailing_int(line)
+                elif "Number of timeout components" in line:
+                    stats["timeout"] = _trailing_int(line)
 
         return CiverParsed(
             stats=stats,
@@ -221,6 +254,9 @@ class CircomCiver(AbstractTool):
         else:
             analysis_status = AnalysisStatus.NO_BUGS
 
+        # Every civer finding is a weak-safety violation
+        bug_title = "Weak-Safety-Violation"
+        unified_bug_title = CIVER_TO_STANDARD[bug_title]
         for component in parsed_output.buggy_components:
             params_str = (
                 f"({', '.join(map(str, component.params))})"
@@ -228,10 +264,9 @@ class CircomCiver(AbstractTool):
                 else ""
             )
 
-            bug_title = "Weak-Safety-Violation"
             finding = Finding(
                 bug_title=bug_title,
-                unified_bug_title=CIVER_TO_STANDARD[bug_title],
+                unified_bug_title=unified_bug_title,
                 description=f"Component {component.name}{params_str} does not satisfy weak safety",
                 position={
                     "component": component.name,
@@ -266,7 +301,7 @@ class CircomCiver(AbstractTool):
             Evaluation result dictionary
         """
         # Load ground truth
-        gt_data = self.load_json_file(ground_truth)
+        gt_data = self.load_json_file(ground_truth, cache=True)
         gt_location = gt_data.get("location", {})
         gt_function = gt_location.get("Function")
 
@@ -18,6 +18,7 @@ from .base import (
     OutputStatus,
     StandardizedBugCategory,
     ToolOutput,
+    extract_link_paths,
     get_tool_result_parsed,
 )
 
@@ -68,6 +69,13 @@ CIRCOMSPECT_TO_STANDARD = {
 }
 
 
+# Patterns used to parse circomspect's output
+_TEMPLATE_RE = re.compile(r"template:\s*(\w+)", re.IGNORECASE)
+_ISSUE_RE = re.compile(r"\s*(warning|note|error)\[([A-Z0-9]+)\]:\s*(.+)")
+_LOCATION_RE = re.compile(r"(.+):(\d+):(\d+)")
+_BOX_DRAWING_RE = re.compile(r"[\u2500-\u257F\u250C-\u254B]")
+
+
 @dataclass
 class CircomspectIssue:
     """Represents a single issue found by circomspect."""
@@ -131,14 +139,23 @@ class CircomspectParsed:
 class Circomspect(AbstractTool):
     """Circomspect static analyzer for Circom circuits."""
 
+    # circomspect exits with 1 when it reports findings
+    exit_codes = EXIT_CODES - {1}
+    fixed_args = ("-l", "INFO", "-v")
+
     def __init__(self):
         super().__init__("circomspect")
-        self.exit_codes = EXIT_CODES - {1}
         if not self.check_binary_exists("circomspect"):
             logging.error("[Binary not found: install circomspect]")
             sys.exit(1)
 
-    def _internal_execute(self, input_paths: Input, timeout: int) -> ToolOutput:
+    def cache_dependencies(self) -> List[str]:
+        """circomspect is a single static binary; cache on it."""
+        return ["circomspect"]
+
+    def _internal_execute(
+        self, input_paths: Input, timeout: int, raw_output_file: Path
+    ) -> ToolOutput:
         """Run circomspect on a given circuit.
 
         circomspect has no library-path flag, so when the wrapper circuit's
@@ -149,8 +166,10 @@ class Circomspect(AbstractTool):
         target_circuit = self._prepare_circuit_for_circomspect(
             input_paths, circuit_file_path
         )
-        cmd = ["circomspect", str(target_circuit), "-l", "INFO", "-v"]
-        return self.run_command(cmd, timeout, input_paths.circuit_dir)
+        cmd = ["circomspect", str(target_circuit), *self.fixed_args]
+        return self.run_command(
+            cmd, timeout, input_paths.circuit_dir, raw_output_file
+        )
 
     def _prepare_circuit_for_circomspect(
         self, input_paths: Input, circuit_file_path: Path
@@ -180,7 +199,7 @@ class Circomspect(AbstractTool):
         target_wrapper = scratch_root / circuit_file_path.name
         shutil.copy2(circuit_file_path, target_wrapper)
 
-        link_paths = self._extract_link_paths(input_paths.link_flags)
+        link_paths = extract_link_paths(input_paths.link_flags)
         for link_path in link_paths:
             link_path_obj = Path(link_path)
             if not link_path_obj.is_dir():
@@ -201,18 +220,6 @@ class Circomspect(AbstractTool):
 
         return target_wrapper
 
-    @staticmethod
-    def _extract_link_paths(link_flags: List[str]) -> List[str]:
-        paths: List[str] = []
-        it = iter(link_flags)
-        for flag in it:
-            if flag in ("-l", "-L", "--link-libraries"):
-                try:
-                    paths.append(next(it))
-                except StopIteration:
-                    break
-        return paths
-
     def _helper_parse_output(self, tool_result_raw: Path) -> CircomspectParsed:
         """Parse circomspect output and extract all issues.
 
@@ -246,14 +253,12 @@ class Circomspect(AbstractTool):
         for i, line in enumerate(bug_info):
             # Track current template
             if "template:" in line.lower():
-                match = re.search(r"template:\s*(\w+)", line, re.IGNORECASE)
+                match = _TEMPLATE_RE.search(line)
                 if match:
                     current_template = match.group(1)
 
             # Detect a warning/note/error line and extract the code
-            match_issue = re.match(
-                r"\s*(warning|note|error)\[([A-Z0-9]+)\]:\s*(.+)", line
-            )
+            match_issue = _ISSUE_RE.match(line)
             if match_issue:
                 current_severity = match_issue.group(1)
                 current_code = match_issue.group(2)
@@ -263,15 +268,11 @@ class Circomspect(AbstractTool):
             if current_code and i + 1 < len(bug_info):
                 try:
                     location_line = bug_info[i + 1]
-                    match_location = re.search(
-                        r"(.+):(\d+):(\d+)", location_line
-                    )
+                    match_location = _LOCATION_RE.search(location_line)
                     if match_location:
                         # Remove box-drawing characters from file path
-                        current_file = re.sub(
-                            r"[\u2500-\u257F\u250C-\u254B]",
-                            "",
-                            match_location.group(1),
+                        current_file = _BOX_DRAWING_RE.sub(
+                            "", match_location.group(1)
                         ).strip()
                         current_line = int(match_location.group(2))
                         current_column = int(match_location.group(3))
@@ -391,7 +392,7 @@ class Circomspect(AbstractTool):
             Evaluation result dictionary
         """
         # Load ground truth
-        gt_data = self.load_json_file(ground_truth)
+        gt_data = self.load_json_file(ground_truth, cache=True)
         gt_vulnerability = gt_data.get("vulnerability")
         gt_location = gt_data.get("location", {})
         gt_function = gt_location.get("Function")
@@ -64,7 +64,9 @@ class EcneProject(AbstractTool):
             logging.error(f"Ecne.jl not found at {ecne_entry}")
             sys.exit(1)
 
-    def _internal_execute(self, input_paths: Input, timeout: int) -> ToolOutput:
+    def _internal_execute(
+        self, input_paths: Input, timeout: int, raw_output_file: Path
+    ) -> ToolOutput:
         """Run EcneProject (Julia) against the circuit's R1CS and sym files.
 
         If the caller pre-compiled (zkbugs_mode via precompile_circuit), use
@@ -87,15 +89,14 @@ class EcneProject(AbstractTool):
                 *input_paths.link_flags,
             ]
             circom_output = self.run_command(
-                cmd, timeout, input_paths.circuit_dir
+                cmd, timeout, input_paths.circuit_dir, raw_output_file
             )
             if circom_output.status != OutputStatus.SUCCESS:
                 return ToolOutput(
                     status=OutputStatus.FAIL,
-                    stdout=circom_output.stdout,
-                    stderr=circom_output.stderr,
                     return_code=circom_output.return_code,
                     msg=f"[Circom failed: {circom_output.msg}]",
+                    byte_len=circom_output.byte_len,
                 )
 
             r1cs_file = next(
@@ -108,18 +109,14 @@ class EcneProject(AbstractTool):
             if not r1cs_file or not sym_file:
                 return ToolOutput(
                     status=OutputStatus.FAIL,
-                    stdout=circom_output.stdout,
-                    stderr=circom_output.stderr,
                     return_code=circom_output.return_code,
                     msg=f"[R1CS or sym file not found: {circom_output.msg}]",
+                    byte_len=circom_output.byte_len,
                 )
             cleanup_artifacts = True
 
         ecne_entry = TOOL_DIR / "src" / "Ecne.jl"
 
-        current_dir = Path.cwd()
-        self.change_directory(TOOL_DIR)
-
         cmd = [
             "julia",
             f"--project={TOOL_DIR}",
@@ -131,8 +128,9 @@ class EcneProject(AbstractTool):
             "--sym",
             str(sym_file),
         ]
-        result = self.run_command(cmd, timeout, input_paths.circuit_dir)
-        self.change_directory(current_dir)
+        result = self.run_command(
+            cmd, timeout, input_paths.circuit_dir, raw_output_file, cwd=TOOL_DIR
+        )
 
         if cleanup_artifacts:
             r1cs_file.unlink(missing_ok=True)
@@ -257,7 +255,7 @@ class EcneProject(AbstractTool):
             Evaluation result dictionary
         """
         # Load ground truth
-        gt_data = self.load_json_file(ground_truth)
+        gt_data = self.load_json_file(ground_truth, cache=True)
         gt_vulnerability = gt_data.get("vulnerability")
 
         # Load tool results
@@ -26,6 +26,10 @@ PICUS_TO_STANDARD = {
 }
 
 
+# ANSI color escape codes in Picus' output
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+
 @dataclass
 class PicusSignal:
     """Signal that can take multiple values (underconstrained)."""
@@ -93,7 +97,9 @@ class Picus(AbstractTool):
             logging.error(f"run-picus is not executable: {run_script}")
             sys.exit(1)
 
-    def _internal_execute(self, input_paths: Input, timeout: int) -> ToolOutput:
+    def _internal_execute(
+        self, input_paths: Input, timeout: int, raw_output_file: Path
+    ) -> ToolOutput:
         """Run Picus on the given circuit.
 
         Picus has no CLI for circom `-l` link paths. When a pre-compiled
@@ -109,13 +115,10 @@ class Picus(AbstractTool):
 
         run_script = TOOL_DIR / "run-picus"
 
-        current_dir = Path.cwd()
-        self.change_directory(TOOL_DIR)
-
         cmd = [str(run_script), str(source_path)]
-        result = self.run_command(cmd, timeout, input_paths.circuit_dir)
-        self.change_directory(current_dir)
-        return result
+        return self.run_command(
+            cmd, timeout, input_paths.circuit_dir, raw_output_file, cwd=TOOL_DIR
+        )
 
     def _helper_parse_output(self, tool_result_raw: Path) -> PicusParsed:
         """Parse Picus output and classify the result.
@@ -131,7 +134,7 @@ class Picus(AbstractTool):
 
         # Helper function to remove ANSI color codes
         def strip_ansi(text: str) -> str:
-            return re.sub(r"\x1b\[[0-9;]*m", "", text)
+            return _ANSI_RE.sub("", text)
 
         # Clean ANSI codes from all lines
         bug_info = [strip_ansi(line) for line in bug_info]
@@ -309,7 +312,7 @@ class Picus(AbstractTool):
             Evaluation result dictionary
         """
         # Load ground truth
-        gt_data = self.load_json_file(ground_truth)
+        gt_data = self.load_json_file(ground_truth, cache=True)
         gt_vulnerability = gt_data.get("vulnerability")
 
         # Load tool results
@@ -23,6 +23,13 @@ ZKFUZZ_TO_STANDARD = {
 }
 
 
+# Patterns used to parse zkfuzz's output
+_LEADING_JUNK_RE = re.compile(r"^[^A-Za-z()]*")
+_TRAILING_JUNK_RE = re.compile(r"[^A-Za-z()]*$")
+_EXPECTED_VALUE_RE = re.compile(r"`([^`]+)`\s+is expected to be\s+`([^`]+)`")
+_ASSIGNMENT_RE = re.compile(r"➡️\s*([^\s=]+)\s*=\s*(\S+)")
+
+
 @dataclass
 class ZkFuzzParsed:
     """Structured parsed output from zkFuzz tool.
@@ -63,12 +70,15 @@ class ZkFuzz(AbstractTool):
             logging.error("[Binary not found: install zkfuzz]")
             sys.exit(1)
 
-    def _internal_execute(self, input_paths: Input, timeout: int) -> ToolOutput:
+    def _internal_execute(
+        self, input_paths: Input, timeout: int, raw_output_file: Path
+    ) -> ToolOutput:
         """Run zkfuzz on the given circuit.
 
         Args:
             input_paths: Input object containing circuit_dir and circuit_file paths
             timeout: Maximum execution time in seconds
+            raw_output_file: Path to file to stream raw output to
 
         Returns:
             ToolOutput object with execution results
@@ -76,7 +86,9 @@ class ZkFuzz(AbstractTool):
         circuit_file_path = Path(input_paths.circuit_file)
 
         cmd = ["zkfuzz", str(circuit_file_path), *input_paths.link_flags]
-        return self.run_command(cmd, timeout, input_paths.circuit_dir)
+        return self.run_command(
+            cmd, timeout, input_paths.circuit_dir, raw_output_file
+        )
 
     def _helper_parse_output(self, tool_result_raw: Path) -> ZkFuzzParsed:
         """Parse zkfuzz output and extract status and vulnerability string.
@@ -117,17 +129,14 @@ class ZkFuzz(AbstractTool):
                 if "Counter Example" in line and i + 1 < len(bug_info):
                     status = "found_bug"
                     vulnerability = bug_info[i + 1]
-                    vulnerability = re.sub(r"^[^A-Za-z()]*", "", vulnerability)
-                    vulnerability = re.sub(r"[^A-Za-z()]*$", "", vulnerability)
+                    vulnerability = _LEADING_JUNK_RE.sub("", vulnerability)
+                    vulnerability = _TRAILING_JUNK_RE.sub("", vulnerability)
 
                     # Extract signal and expected value from "is expected to be" line
                     # Format: ➡️ `main.c` is expected to be `21888...`
                     for j in range(i, min(i + 10, len(bug_info))):
                         if "is expected to be" in bug_info[j]:
-                            match = re.search(
-                                r"`([^`]+)`\s+is expected to be\s+`([^`]+)`",
-                                bug_info[j],
-                            )
+                            match = _EXPECTED_VALUE_RE.search(bug_info[j])
                             if match:
                                 signal = match.group(1)
                                 expected_value = match.group(2)
@@ -147,9 +156,7 @@ class ZkFuzz(AbstractTool):
                             ].startswith("╔"):
                                 break
                             # Parse assignment line: ➡️ main.a = 21888...
-                            assign_match = re.search(
-                                r"➡️\s*([^\s=]+)\s*=\s*(\S+)", bug_info[j]
-                            )
+                            assign_match = _ASSIGNMENT_RE.search(bug_info[j])
                             if assign_match:
                                 var_name = assign_match.group(1)
                                 var_value = assign_match.group(2)
@@ -255,7 +262,7 @@ class ZkFuzz(AbstractTool):
             Evaluation result dictionary
         """
         # Load ground truth
-        gt_data = self.load_json_file(ground_truth)
+        gt_data = self.load_json_file(ground_truth, cache=True)
         gt_vulnerability = gt_data.get("vulnerability")
 
         # Load tool results
@@ -0,0 +1,69 @@
+"""
+JSON input/output helpers.
+
+Uses orjson when it is installed (it is not a required dependency) and
+falls back to the standard library otherwise. Both produce the same
+2-space-indented UTF-8 output.
+"""
+
+import json
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Serialize the non-JSON types that appear in zkhydra's outputs."""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(
+        f"Object of type {type(obj).__name__} is not JSON serializable"
+    )
+
+
+def write_json(path: Path, data: Any) -> None:
+    """Write data to a file as 2-space-indented JSON.
+
+    Args:
+        path: Path of the file to write
+        data: JSON-serializable data (Enum and Path values are converted)
+    """
+    if orjson is not None:
+        path.write_bytes(
+            orjson.dumps(
+                data,
+                default=_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            )
+        )
+        return
+
+    path.write_text(
+        json.dumps(data, indent=2, ensure_ascii=False, default=_default),
+        encoding="utf-8",
+    )
+
+
+def read_json(path: Path) -> Any:
+    """Read and parse a JSON file.
+
+    The file is read as bytes and parsed directly, skipping the text
+    decoding layer.
+
+    Args:
+        path: Path of the file to read
+
+    Returns:
+        Parsed JSON data
+    """
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
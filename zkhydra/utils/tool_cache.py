@@ -0,0 +1,231 @@
+"""
+On-disk cache of tool runs.
+
+Re-running a tool on an unchanged circuit with an unchanged binary yields the
+same raw output, so execute_tools can restore a cached raw.txt instead of
+invoking the subprocess again. Entries are keyed on the tool name, its
+fixed arguments, the timeout, the link flags, the contents of the circuit
+and every file it (transitively) includes, and the size/mtime of the tool's
+executables.
+Only successful runs are cached.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import replace
+from pathlib import Path
+
+from zkhydra.tools.base import (
+    INCLUDE_RE,
+    AbstractTool,
+    Input,
+    OutputStatus,
+    ToolOutput,
+    ensure_dir,
+    extract_link_paths,
+    which,
+)
+from zkhydra.utils.json_io import read_json, write_json
+
+# Bump to invalidate every existing cache entry.
+CACHE_VERSION = 1
+
+
+def default_cache_dir() -> Path:
+    """Return the default cache directory ($XDG_CACHE_HOME/zkhydra)."""
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / "zkhydra"
+
+
+def _resolve_include(
+    include: str, base_dir: Path, link_dirs: list[Path]
+) -> Path | None:
+    """Resolve an include the way circom does: relative to the including
+    file first, then against each library directory in order."""
+    for directory in (base_dir, *link_dirs):
+        candidate = directory / include
+        if candidate.is_file():
+            return candidate.resolve()
+    return None
+
+
+class ToolCache:
+    """Content-addressed store of successful tool runs."""
+
+    def __init__(self, cache_dir: Path | None = None):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cache entries (default:
+                $XDG_CACHE_HOME/zkhydra)
+        """
+        self.cache_dir = cache_dir if cache_dir else default_cache_dir()
+
+    def key(
+        self, tool: AbstractTool, input_paths: Input, timeout: int
+    ) -> str | None:
+        """Compute the cache key for running a tool on a circuit.
+
+        Args:
+            tool: Tool instance to run
+            input_paths: Input object containing circuit paths and link flags
+            timeout: Timeout per tool in seconds
+
+        Returns:
+            Hex digest, or None if the tool's results cannot be cached
+        """
+        dependencies = tool.cache_dependencies()
+        if not dependencies:
+            return None
+
+        digest = hashlib.blake2b(digest_size=20)
+        header = [
+            CACHE_VERSION,
+            tool.name,
+            list(tool.fixed_args),
+            timeout,
+            input_paths.circuit_file,
+            input_paths.link_flags,
+            bool(input_paths.r1cs_file and input_paths.sym_file),
+        ]
+        digest.update(json.dumps(header).encode())
+
+        # Executables are fingerprinted by size and mtime rather than
+        # content, so the key stays cheap even for large binaries.
+        for dependency in dependencies:
+            path = (
+                dependency if os.path.dirname(dependency) else which(dependency)
+            )
+            if path is None:
+                return None
+            try:
+                st = os.stat(path)
+            except OSError:
+                return None
+            fingerprint = (
+                f"{os.path.realpath(path)}:{st.st_size}:{st.st_mtime_ns}"
+            )
+            digest.update(f"\0{fingerprint}".encode())
+
+        link_dirs = [
+            Path(p) for p in extract_link_paths(input_paths.link_flags)
+        ]
+        pending = [Path(input_paths.circuit_file).resolve()]
+        seen = set()
+        while pending:
+            source = pending.pop()
+            if source in seen:
+                continue
+            seen.add(source)
+            try:
+                data = source.read_bytes()
+            except OSError:
+                return None
+            digest.update(f"\0{source}\0".encode())
+            digest.update(data)
+            text = data.decode("utf-8", errors="replace")
+            for include in INCLUDE_RE.findall(text):
+                # An unreadable library directory (e.g. EACCES) leaves the
+                # include set unknown, so the run is not cached.
+                try:
+                    resolved = _resolve_include(
+                        include, source.parent, link_dirs
+                    )
+                except OSError:
+                    return None
+                if resolved is not None:
+                    pending.append(resolved)
+
+        return digest.hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        """Return the entry path (without suffix) for a cache key."""
+        return self.cache_dir / key[:2] / key
+
+    def load(self, key: str, raw_output_file: Path) -> ToolOutput | None:
+        """Restore a cached run into raw_output_file.
+
+        Also writes tool_output.json next to raw_output_file, as
+        AbstractTool.execute does for a fresh run. The restored output
+        reports the time spent restoring it, not the original run's
+        duration, is flagged as cached and its message is prefixed with
+        "[Cached]".
+
+        Args:
+            key: Cache key from key()
+            raw_output_file: Path to restore the raw output to
+
+        Returns:
+            The cached ToolOutput, or None on a cache miss
+        """
+        start = time.perf_counter_ns()
+        entry = self._entry(key)
+        try:
+            cached = ToolOutput.from_dict(
+                read_json(entry.with_suffix(".json"))
+            )
+            shutil.copyfile(entry.with_suffix(".raw"), raw_output_file)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # Unreadable or malformed entries are treated as misses
+            return None
+
+        tool_output = replace(
+            cached,
+            msg=f"[Cached] {cached.msg}",
+            execution_time_ns=time.perf_counter_ns() - start,
+            raw_output_file=str(raw_output_file),
+            cached=True,
+        )
+        write_json(
+            raw_output_file.parent / "tool_output.json", tool_output.to_dict()
+        )
+        return tool_output
+
+    def store(self, key: str, tool_output: ToolOutput) -> None:
+        """Cache a tool run. Only successful runs are stored.
+
+        Args:
+            key: Cache key from key()
+            tool_output: Output of AbstractTool.execute
+        """
+        if tool_output.status != OutputStatus.SUCCESS:
+            return
+
+        entry = self._entry(key)
+        data = replace(tool_output, raw_output_file=None).to_dict()
+        try:
+            ensure_dir(entry.parent)
+            self._write_atomic(
+                entry.with_suffix(".raw"),
+                lambda tmp: shutil.copyfile(tool_output.raw_output_file, tmp),
+            )
+            # The .json file is written last: its presence marks the entry
+            # as complete.
+            self._write_atomic(
+                entry.with_suffix(".json"), lambda tmp: write_json(tmp, data)
+            )
+        except OSError as e:
+            logging.warning(f"Failed to write cache entry {entry}: {e}")
+
+    @staticmethod
+    def _write_atomic(path: Path, write: Callable[[Path], object]) -> None:
+        """Write a file via a temporary file and os.replace, so concurrent
+        readers (e.g. parallel zkbugs workers) never see partial entries.
+
+        write is called with the temporary file's path."""
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        try:
+            write(tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
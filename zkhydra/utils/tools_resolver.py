@@ -2,30 +2,26 @@
 Tool resolution system for zkHydra.
 
 This module provides a simple registry-based system for resolving tools by name.
-All tools are registered in a central TOOL_REGISTRY lookup table.
+All tools are registered in a central TOOL_REGISTRY lookup table. Tool modules
+are only imported once a tool is actually resolved.
 """
 
+import importlib
 import logging
 
 from zkhydra.tools.base import AbstractTool
 
-# Import all tool instances
-from zkhydra.tools.circom_civer import CircomCiver
-from zkhydra.tools.circomspect import Circomspect
-from zkhydra.tools.ecneproject import EcneProject
-from zkhydra.tools.picus import Picus
-from zkhydra.tools.zkfuzz import ZkFuzz
-
 # Type alias for tools dictionary (for clarity in type hints)
 type ToolsDict = dict[str, AbstractTool]
 
 
-TOOL_REGISTRY: ToolsDict = {
-    "circomspect": Circomspect,
-    "circom_civer": CircomCiver,
-    "zkfuzz": ZkFuzz,
-    "picus": Picus,
-    "ecneproject": EcneProject,
+# Tool name -> (module, class name), imported lazily by resolve_tools
+TOOL_REGISTRY: dict[str, tuple[str, str]] = {
+    "circomspect": ("zkhydra.tools.circomspect", "Circomspect"),
+    "circom_civer": ("zkhydra.tools.circom_civer", "CircomCiver"),
+    "zkfuzz": ("zkhydra.tools.zkfuzz", "ZkFuzz"),
+    "picus": ("zkhydra.tools.picus", "Picus"),
+    "ecneproject": ("zkhydra.tools.ecneproject", "EcneProject"),
     # Add other tools here as they are refactored
 }
 
@@ -55,7 +51,9 @@ def resolve_tools(tools: list[str]) -> ToolsDict:
             )
             continue
 
-        loaded[tool_name] = TOOL_REGISTRY[tool_name]()
+        module_name, class_name = TOOL_REGISTRY[tool_name]
+        tool_class = getattr(importlib.import_module(module_name), class_name)
+        loaded[tool_name] = tool_class()
         logging.debug(
             f"Resolved {tool_name} -> {loaded[tool_name].__class__.__name__}"
         )